@@ -1,7 +1,95 @@
 import time
-import json
+import heapq
 import os
 import sys
+import atexit
+import threading
+import weakref
+
+# Prefix that marks a msgpack dump, so JSON dumps from older versions can still be loaded.
+_MSGPACK_MAGIC = b"PYRDMP\x01"
+
+_json_codec = None
+_msgpack = None
+
+# Sentinel for dict.pop() so a missing key can be told apart in a single lookup.
+_MISSING = object()
+
+# Stale expiry heap entries tolerated beyond twice the store size before the heap is rebuilt.
+_HEAP_SLACK = 1024
+
+# Live PyRedis instances, flushed at interpreter exit. Held weakly so stores that are
+# no longer used can still be garbage collected.
+_instances = weakref.WeakSet()
+
+
+def _noop(*args, **kwargs):
+    """
+    Does nothing; stands in for log output when verbose is off.
+    """
+
+
+def _get_logger():
+    """
+    Imports logging on first use and returns the "pyredis" logger at INFO level.
+
+    If nothing else has configured the logger, a plain stdout handler is attached so the
+    output looks like the CLI's own prints. Only verbose instances call this, so quiet
+    ones never pay for importing logging.
+    """
+    import logging
+    logger = logging.getLogger("pyredis")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    return logger
+
+
+def _flush_all():
+    """
+    Flushes pending changes of every live PyRedis instance; registered with atexit.
+    """
+    for instance in list(_instances):
+        instance.flush()
+
+
+atexit.register(_flush_all)
+
+
+def _get_json_codec():
+    """
+    Imports the JSON backend on first use and returns its (dumps, loads) pair.
+
+    orjson is preferred when installed; the stdlib json module is the fallback.
+    """
+    global _json_codec
+    if _json_codec is None:
+        try:
+            import orjson
+            _json_codec = (orjson.dumps, orjson.loads)
+        except ImportError:
+            import json
+            _json_codec = (lambda data: json.dumps(data).encode("utf-8"), json.loads)
+    return _json_codec
+
+
+def _get_msgpack():
+    """
+    Imports msgpack on first use.
+
+    :return: The msgpack module, or None if it is not installed.
+    """
+    global _msgpack
+    if _msgpack is None:
+        try:
+            import msgpack
+            _msgpack = msgpack
+        except ImportError:
+            _msgpack = False
+    return _msgpack or None
 
 
 class PyRedis:
@@ -9,19 +97,41 @@ class PyRedis:
     A simple Redis-like key-value store that supports TTL (time-to-live) and auto-save features.
     """
 
-    def __init__(self, expiration_time=365 * 24 * 60 * 60, auto_save=True, verbose=True):
+    def __init__(self, expiration_time=365 * 24 * 60 * 60, auto_save=True, verbose=True,
+                 filename="pyredis_dump.json", flush_interval=1.0):
         """
         Initializes the PyRedis store.
 
         :param expiration_time: Default TTL (in seconds) for the keys.
         :param auto_save: Boolean flag to enable/disable auto-save. Default is True.
-        :param verbose: Boolean flag to enable/disable print statements. Default is True.
+        :param verbose: Boolean flag to enable/disable informational log output. Default is True.
+        :param filename: Default file used by save, load and auto-save. Auto-saved changes are
+            appended to an append-only log next to it (filename + ".aof") between snapshots.
+        :param flush_interval: Delay (in seconds) used to batch auto-saves after a mutation.
         """
+        # Maps each key to a (value, expiration timestamp) tuple.
         self.store = {}
-        self.expirations = {}
+        self._exp_heap = []
+        # Timestamp of the command being processed, set by drivers such as the CLI so one
+        # command reads the clock only once. None means "ask time.time()".
+        self._now = None
+        # Guards writes to store and _exp_heap; the flush timer thread reaps expired keys.
+        self._store_lock = threading.Lock()
         self.auto_save_enabled = auto_save
         self.expiration_time = expiration_time
         self.verbose = verbose
+        # Bound once here so the hot paths never re-check verbose or the log level.
+        self._emit = _get_logger().info if verbose else _noop
+        self.filename = filename
+        self._flush_interval = flush_interval
+        self._dirty = False
+        self._flush_timer = None
+        self._flush_lock = threading.Lock()
+        self._aof = None
+        self._aof_records = 0
+        self._aof_lock = threading.Lock()
+        self._needs_snapshot = False
+        _instances.add(self)
 
     def set(self, *key_values, ttl=None):
         """
@@ -30,21 +140,64 @@ class PyRedis:
         :param key_values: Key-value pairs to be set, e.g., ("firstname John", "lastname Doe").
         :param ttl: Time-to-live (in seconds) for the keys. Default is the instance's expiration_time.
         """
+        if ttl is None:
+            ttl = self.expiration_time
+        expiry = (self._now or time.time()) + ttl
+        records = []
         for kv in key_values:
-            try:
-                key, value = kv.split(", ") if ", " in kv else kv.split()
-                self.store[key] = value
-                if ttl is None:
-                    ttl = self.expiration_time
-                self.expirations[key] = time.time() + ttl
-                if self.verbose:
-                    print(f"SET {key} = {value}")
-            except ValueError:
-                if self.verbose:
-                    print(f"Error: Invalid format for key-value pair '{kv}'. Use 'key value' or 'key, value'.")
+            key, sep, value = kv.partition(", ")
+            if not sep:
+                # First run of any whitespace (spaces, tabs, ...) separates key and value.
+                parts = kv.split(None, 1)
+                key, value = parts if len(parts) == 2 else (kv, "")
+            if not key or not value:
+                self._emit("Error: Invalid format for key-value pair '%s'. Use 'key value' or 'key, value'.", kv)
+                continue
+            # Interned keys let later lookups of the same key match by identity.
+            key = sys.intern(key)
+            self._store_entry(key, value, expiry)
+            records.append(("SET", key, value, expiry))
+            self._emit("SET %s = %s", key, value)
 
+        # Only pay for auto-save when at least one pair was actually stored.
+        if records and self.auto_save_enabled:
+            self._append_aof(records)
+            self._mark_dirty()
+
+    def set_pair(self, key, value, ttl=None):
+        """
+        Set a single key to a value, without parsing a "key value" string.
+
+        :param key: The key to set; must be a non-empty string.
+        :param value: The value to store; must be a non-empty string.
+        :param ttl: Time-to-live (in seconds) for the key. Default is the instance's expiration_time.
+        :raises ValueError: If the key or value is not a non-empty string.
+        """
+        if not isinstance(key, str) or not key:
+            raise ValueError(f"Invalid key {key!r}: expected a non-empty string")
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"Invalid value {value!r}: expected a non-empty string")
+        if ttl is None:
+            ttl = self.expiration_time
+        expiry = (self._now or time.time()) + ttl
+        key = sys.intern(key)
+        self._store_entry(key, value, expiry)
+        self._emit("SET %s = %s", key, value)
         if self.auto_save_enabled:
-            self.save()
+            self._append_aof([("SET", key, value, expiry)])
+            self._mark_dirty()
+
+    def _store_entry(self, key, value, expiry):
+        """
+        Writes a key to the store and schedules its expiration on the heap.
+        """
+        with self._store_lock:
+            self.store[key] = (value, expiry)
+            heapq.heappush(self._exp_heap, (expiry, key))
+            # Overwrites and deletes leave stale entries behind; rebuild once they dominate.
+            if len(self._exp_heap) > 2 * len(self.store) + _HEAP_SLACK:
+                self._exp_heap = [(entry[1], key) for key, entry in self.store.items()]
+                heapq.heapify(self._exp_heap)
 
     def get(self, key):
         """
@@ -53,14 +206,20 @@ class PyRedis:
         :param key: The key to retrieve.
         :return: The value associated with the key, or None if expired or does not exist.
         """
-        if self._is_expired(key):
+        if isinstance(key, str):
+            key = sys.intern(key)
+        now = self._now or time.time()
+        entry = self.store.get(key)
+        expired = entry is not None and now > entry[1]
+        if expired:
             self.delete(key)
-            if self.verbose:
-                print(f"GET {key}: key expired or does not exist")
+        # Reap only after the lookup, so the requested key is still reported as expired.
+        self._reap_expired(now)
+        if expired:
+            self._emit("GET %s: key expired or does not exist", key)
             return None
-        value = self.store.get(key)
-        if self.verbose:
-            print(f"GET {key} = {value}")
+        value = entry[0] if entry is not None else None
+        self._emit("GET %s = %s", key, value)
         return value
 
     def delete(self, key):
@@ -69,77 +228,259 @@ class PyRedis:
 
         :param key: The key to delete.
         """
-        if key in self.store:
-            del self.store[key]
-            if key in self.expirations:
-                del self.expirations[key]
-            if self.verbose:
-                print(f"DELETE {key}")
+        if isinstance(key, str):
+            key = sys.intern(key)
+        with self._store_lock:
+            entry = self.store.pop(key, _MISSING)
+        if entry is _MISSING:
+            self._emit("DELETE %s: key does not exist", key)
         else:
-            if self.verbose:
-                print(f"DELETE {key}: key does not exist")
+            self._emit("DELETE %s", key)
+            if self.auto_save_enabled:
+                self._append_aof([("DEL", key)])
+                self._mark_dirty()
 
-        if self.auto_save_enabled:
-            self.save()
+    def _reap_expired(self, now=None):
+        """
+        Removes every key whose TTL has passed, oldest first.
 
-    def _is_expired(self, key):
+        Heap entries left behind by overwritten or deleted keys are skipped by
+        comparing them against the key's current expiration.
+
+        :param now: Current timestamp, if the caller already has one.
+        """
+        if now is None:
+            now = time.time()
+        with self._store_lock:
+            heap = self._exp_heap
+            while heap and heap[0][0] <= now:
+                ts, key = heapq.heappop(heap)
+                entry = self.store.get(key)
+                if entry is not None and entry[1] == ts:
+                    self.store.pop(key, None)
+
+    def _open_aof(self):
+        """
+        Returns the append-only log for the instance's filename, opening it on first use.
+
+        Must be called with _aof_lock held.
         """
-        Checks if a key has expired.
+        if self._aof is None:
+            self._aof = open(self.filename + ".aof", "ab", buffering=8192)
+        return self._aof
 
-        :param key: The key to check.
-        :return: True if expired, False otherwise.
+    def _append_aof(self, records):
         """
-        if key not in self.expirations:
-            return False
-        return time.time() > self.expirations[key]
+        Appends mutation records to the append-only log, one JSON line per record.
 
-    def save(self, filename="pyredis_dump.json"):
+        :param records: ("SET", key, value, expiry) or ("DEL", key) tuples.
         """
-        Saves the current store and expiration data to a JSON file.
+        dumps, _ = _get_json_codec()
+        payload = b"".join([dumps(record) + b"\n" for record in records])
+        with self._aof_lock:
+            self._open_aof().write(payload)
+            self._aof_records += len(records)
+
+    def _replay_aof(self, aof_filename, store):
+        """
+        Applies the records of an append-only log to store.
+
+        A torn record at the end of the log (from a crash mid-write) ends the replay.
+
+        :param aof_filename: The log to replay.
+        :param store: The store dict to apply the records to.
+        :return: The number of records applied, or None if the log does not exist.
+        """
+        try:
+            with open(aof_filename, "rb") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+        _, loads = _get_json_codec()
+        count = 0
+        for line in lines:
+            try:
+                record = loads(line)
+            except ValueError:
+                break
+            if record[0] == "SET":
+                store[record[1]] = (record[2], record[3])
+            else:
+                store.pop(record[1], None)
+            count += 1
+        return count
+
+    def _mark_dirty(self):
+        """
+        Records a pending change and arms the flush timer if it is not already running.
+        """
+        with self._flush_lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """
+        Writes pending auto-save changes to disk immediately.
+
+        Normally only the append-only log is flushed. A full snapshot is written (which
+        also empties the log) once the log holds more records than the store has keys,
+        keeping replay time on load proportional to the store size.
+        """
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        with self._aof_lock:
+            compact = self._needs_snapshot or self._aof_records > len(self.store)
+            if not compact and self._aof is not None:
+                self._aof.flush()
+                os.fsync(self._aof.fileno())
+        if compact:
+            self.save()
+
+    def save(self, filename=None):
+        """
+        Saves the current store, including expirations, to a file.
+
+        The dump is written with msgpack when it is installed and as JSON otherwise.
 
-        :param filename: The file to save the data to.
+        :param filename: The file to save the data to. Defaults to the instance's filename.
         """
-        with open(filename, "w") as f:
+        if filename is None:
+            filename = self.filename
+        self._reap_expired()
+        # Hold the log lock so no mutation lands between the snapshot and the log truncation.
+        with self._aof_lock:
             data = {
-                "store": self.store,
-                "expirations": self.expirations
+                "store": dict(self.store)
             }
-            json.dump(data, f)
-        if self.verbose:
-            print(f"Data saved to {filename}")
+            msgpack = _get_msgpack()
+            if msgpack is not None:
+                payload = _MSGPACK_MAGIC + msgpack.packb(data, use_bin_type=True)
+            else:
+                dumps, _ = _get_json_codec()
+                payload = dumps(data)
 
-    def load(self, filename="pyredis_dump.json"):
+            # Write to a temporary file first so a crash never leaves a truncated dump behind.
+            tmp_filename = filename + ".tmp"
+            with open(tmp_filename, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, filename)
+
+            if filename == self.filename:
+                # The snapshot now covers everything in the log.
+                if self._aof is not None or os.path.exists(filename + ".aof"):
+                    self._open_aof().truncate(0)
+                self._aof_records = 0
+                self._needs_snapshot = False
+        self._emit("Data saved to %s", filename)
+
+    def load(self, filename=None):
         """
-        Loads store and expiration data from a JSON file.
+        Loads the store, including expirations, from a msgpack or JSON dump and then
+        replays its append-only log, if there is one.
 
-        :param filename: The file to load data from.
+        :param filename: The file to load data from. Defaults to the instance's filename.
         """
+        if filename is None:
+            filename = self.filename
         try:
-            with open(filename, "r") as f:
-                data = json.load(f)
-                self.store = data["store"]
-                self.expirations = data["expirations"]
-            if self.verbose:
-                print(f"Data loaded from {filename}")
+            with open(filename, "rb") as f:
+                raw = f.read()
         except FileNotFoundError:
-            if self.verbose:
-                print(f"No existing data found in {filename}")
+            raw = None
+
+        if not raw:
+            # Missing or empty snapshot: everything comes from the log, if there is one.
+            store = {}
+        else:
+            if raw.startswith(_MSGPACK_MAGIC):
+                msgpack = _get_msgpack()
+                if msgpack is None:
+                    raise RuntimeError(f"{filename} is a msgpack dump; install msgpack to load it")
+                # use_list=False decodes the (value, expiry) pairs straight into tuples in C,
+                # so the store can be used as-is without a Python-level pass over every key.
+                store = msgpack.unpackb(raw[len(_MSGPACK_MAGIC):], raw=False, use_list=False)["store"]
+            else:
+                _, loads = _get_json_codec()
+                data = loads(raw)
+                if "expirations" in data:
+                    # Dumps written before values and expirations were stored together.
+                    expirations = data["expirations"]
+                    store = {key: (value, expirations[key]) for key, value in data["store"].items()}
+                else:
+                    store = {key: tuple(entry) for key, entry in data["store"].items()}
+
+        with self._aof_lock:
+            if self._aof is not None:
+                self._aof.flush()
+            replayed = self._replay_aof(filename + ".aof", store)
+            if raw is None and replayed is None:
+                self._emit("No existing data found in %s", filename)
+                return
+            if filename == self.filename:
+                self._aof_records = replayed or 0
+            else:
+                # The log for our own filename no longer describes the store.
+                self._needs_snapshot = True
+
+        exp_heap = [(entry[1], key) for key, entry in store.items()]
+        heapq.heapify(exp_heap)
+        with self._store_lock:
+            self.store = store
+            self._exp_heap = exp_heap
+        self._emit("Data loaded from %s", filename)
+
+    def close(self):
+        """
+        Flushes pending changes, closes the append-only log and stops tracking the
+        instance for the exit-time flush.
+        """
+        self.flush()
+        with self._aof_lock:
+            if self._aof is not None:
+                self._aof.close()
+                self._aof = None
+        _instances.discard(self)
 
     def enable_auto_save(self):
         """
         Enables the auto-save feature.
         """
         self.auto_save_enabled = True
-        if self.verbose:
-            print("Auto-save enabled")
+        # Changes made while auto-save was off (or before it was ever on) never reached the
+        # log, so write a fresh snapshot.
+        self._needs_snapshot = True
+        self._mark_dirty()
+        self._emit("Auto-save enabled")
 
     def disable_auto_save(self):
         """
         Disables the auto-save feature.
         """
+        # Write out changes made while auto-save was still on and cancel the pending timer,
+        # so it cannot later persist changes made after this point.
+        self.flush()
         self.auto_save_enabled = False
-        if self.verbose:
-            print("Auto-save disabled")
+        self._needs_snapshot = True
+        self._emit("Auto-save disabled")
+
+
+# Opcodes for PyRedisCLI.run_binary().
+OP_SET = 0
+OP_GET = 1
+OP_DELETE = 2
+OP_SAVE = 3
+OP_LOAD = 4
+OP_EXIT = 5
 
 
 class PyRedisCLI:
@@ -147,88 +488,249 @@ class PyRedisCLI:
     Command-line interface for interacting with the PyRedis key-value store.
     """
 
-    def __init__(self, savefile_path="pyredis_dump.json", expiration_time=365 * 24 * 60 * 60, verbose=True):
+    def __init__(self, savefile_path="pyredis_dump.json", expiration_time=365 * 24 * 60 * 60, verbose=True,
+                 autoload=True):
         """
         Initializes the CLI with optional save file path and expiration time.
 
         :param savefile_path: Path to the save file.
         :param expiration_time: Default TTL for keys.
         :param verbose: Boolean flag to enable/disable print statements in PyRedis.
+        :param autoload: Boolean flag to load the save file on startup. Default is True.
         """
-        self.redis = PyRedis(expiration_time, auto_save=True, verbose=verbose)
+        self.redis = PyRedis(expiration_time, auto_save=True, verbose=verbose, filename=savefile_path)
         self.savefile_path = savefile_path
-        if os.path.exists(self.savefile_path):
-            self.redis.load(self.savefile_path)
-        else:
-            if verbose:
+        if autoload:
+            if any(os.path.exists(path) and os.path.getsize(path) > 0
+                   for path in (self.savefile_path, self.savefile_path + ".aof")):
+                self.redis.load(self.savefile_path)
+            elif verbose:
                 print(f"No save file found at {self.savefile_path}. Starting fresh.")
 
+        self._dispatch = {
+            "SET": self._cmd_set,
+            "GET": self._cmd_get,
+            "DELETE": self._cmd_delete,
+            "SAVE": self._cmd_save,
+            "LOAD": self._cmd_load,
+            "ENABLE_AUTOSAVE": self._cmd_enable_autosave,
+            "DISABLE_AUTOSAVE": self._cmd_disable_autosave,
+            "EXIT": self._cmd_exit,
+        }
+        # Register lower-case spellings too, so the common cases need no upper() per line.
+        self._dispatch.update({cmd.lower(): handler for cmd, handler in self._dispatch.items()})
+
+        # Opcodes understood by run_binary().
+        self._binary_dispatch = {
+            OP_SET: self.redis.set_pair,
+            OP_GET: self.redis.get,
+            OP_DELETE: self.redis.delete,
+            OP_SAVE: self._bin_save,
+            OP_LOAD: self._bin_load,
+            OP_EXIT: self.redis.flush,
+        }
+
+    def _cmd_set(self, cmd_vals):
+        """
+        Handles SET key value[, key value, ...][, ttl].
+        """
+        cmd_vals = cmd_vals.strip()  # Clean any extra spaces
+        if len(cmd_vals.split(',')) >= 1:  # Minimum for one key-value pair
+            key_value_pairs = [kv.strip() for kv in cmd_vals.split(',')]
+            ttl = None
+
+            if len(key_value_pairs) % 2 == 1:  # Check if TTL is included
+                ttl = int(key_value_pairs.pop())  # Remove TTL from key-value pairs
+
+            self.redis.set(*key_value_pairs, ttl=ttl)
+        else:
+            print("Error: SET command requires at least two arguments (key and value).")
+
+    def _cmd_get(self, cmd_vals):
+        """
+        Handles GET key.
+        """
+        if cmd_vals:
+            self.redis.get(cmd_vals)
+        else:
+            print("Error: GET command requires a key.")
+
+    def _cmd_delete(self, cmd_vals):
+        """
+        Handles DELETE key.
+        """
+        if cmd_vals:
+            self.redis.delete(cmd_vals)
+        else:
+            print("Error: DELETE command requires a key.")
+
+    def _cmd_save(self, cmd_vals):
+        """
+        Handles SAVE.
+        """
+        self.redis.save(self.savefile_path)
+
+    def _cmd_load(self, cmd_vals):
+        """
+        Handles LOAD.
+        """
+        self.redis.load(self.savefile_path)
+
+    def _cmd_enable_autosave(self, cmd_vals):
+        """
+        Handles ENABLE_AUTOSAVE.
+        """
+        self.redis.enable_auto_save()
+
+    def _cmd_disable_autosave(self, cmd_vals):
+        """
+        Handles DISABLE_AUTOSAVE.
+        """
+        self.redis.disable_auto_save()
+
+    def _cmd_exit(self, cmd_vals):
+        """
+        Handles EXIT.
+
+        :return: True to tell the CLI loop to stop.
+        """
+        self.redis.flush()
+        print("Exiting PyRedis CLI")
+        return True
+
+    def _bin_save(self):
+        """
+        Handles a binary SAVE request.
+        """
+        self.redis.save(self.savefile_path)
+
+    def _bin_load(self):
+        """
+        Handles a binary LOAD request.
+        """
+        self.redis.load(self.savefile_path)
+
+    def _read_commands(self):
+        """
+        Yields raw command lines from stdin.
+
+        Interactive sessions are prompted line by line with input(); piped input is
+        read straight from the buffered sys.stdin iterator, which is much faster for
+        bulk loads.
+        """
+        if sys.stdin.isatty():
+            while True:
+                try:
+                    yield input("pyredis> ")
+                except EOFError:
+                    return
+        else:
+            yield from sys.stdin
+
     def run(self):
         """
         Starts the PyRedis CLI loop.
         """
         print("Welcome to PyRedis CLI")
-        while True:
+        for input_str in self._read_commands():
             try:
-                input_str = input("pyredis> ").strip()
+                input_str = input_str.strip()
                 if not input_str:
                     continue
+                self.redis._now = time.time()
 
                 # Split command and values
-                parts = input_str.split(' ', 1)
-                cmd = parts[0].upper()
-                cmd_vals = parts[1] if len(parts) > 1 else ""
-
-                if cmd == "SET":
-                    cmd_vals = cmd_vals.strip()  # Clean any extra spaces
-                    if len(cmd_vals.split(',')) >= 1:  # Minimum for one key-value pair
-                        key_value_pairs = [kv.strip() for kv in cmd_vals.split(',')]
-                        ttl = None
-                        
-                        if len(key_value_pairs) % 2 == 1:  # Check if TTL is included
-                            ttl = int(key_value_pairs.pop())  # Remove TTL from key-value pairs
-                        
-                        self.redis.set(*key_value_pairs, ttl=ttl)
-                    else:
-                        print("Error: SET command requires at least two arguments (key and value).")
-                elif cmd == "GET":
-                    if cmd_vals:
-                        self.redis.get(cmd_vals)
-                    else:
-                        print("Error: GET command requires a key.")
-                elif cmd == "DELETE":
-                    if cmd_vals:
-                        self.redis.delete(cmd_vals)
-                    else:
-                        print("Error: DELETE command requires a key.")
-                elif cmd == "SAVE":
-                    self.redis.save(self.savefile_path)
-                elif cmd == "LOAD":
-                    self.redis.load(self.savefile_path)
-                elif cmd == "ENABLE_AUTOSAVE":
-                    self.redis.enable_auto_save()
-                elif cmd == "DISABLE_AUTOSAVE":
-                    self.redis.disable_auto_save()
-                elif cmd == "EXIT":
-                    print("Exiting PyRedis CLI")
-                    break
+                sp = input_str.find(' ')
+                if sp < 0:
+                    cmd, cmd_vals = input_str, ""
                 else:
+                    cmd, cmd_vals = input_str[:sp], input_str[sp + 1:]
+
+                handler = self._dispatch.get(cmd) or self._dispatch.get(cmd.upper())
+                if handler is None:
                     print("Unknown command")
+                elif handler(cmd_vals):
+                    break
             except Exception as e:
                 print(f"Error: {e}")
+            finally:
+                # The cached timestamp is only valid for the command that set it.
+                self.redis._now = None
+        else:
+            # End of input without an explicit EXIT: write out anything still pending.
+            self.redis.flush()
+
+    def run_binary(self):
+        """
+        Serves msgpack-framed requests from stdin until EOF or an OP_EXIT request.
+
+        Each request is a 4-byte big-endian length followed by a msgpack array of
+        [opcode, key, value, ttl], with trailing items omitted when the opcode takes fewer
+        arguments. Each reply uses the same framing and holds [ok, result], where result
+        is an error message when ok is false. Requires msgpack.
+        """
+        msgpack = _get_msgpack()
+        stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+        while True:
+            header = stdin.read(4)
+            if len(header) < 4:
+                break
+            size = int.from_bytes(header, "big")
+            body = stdin.read(size)
+            opcode = None
+            # Malformed frames get an error reply like any failed command instead of
+            # ending the loop.
+            try:
+                if len(body) < size:
+                    raise ValueError("Truncated request")
+                request = msgpack.unpackb(body, raw=False)
+                if not isinstance(request, (list, tuple)) or not request:
+                    raise ValueError("Request must be a non-empty array")
+                opcode = request[0]
+                handler = self._binary_dispatch.get(opcode)
+                if handler is None:
+                    raise ValueError("Unknown command")
+                self.redis._now = time.time()
+                reply = (True, handler(*request[1:]))
+            except Exception as e:
+                reply = (False, str(e) or type(e).__name__)
+            finally:
+                self.redis._now = None
+            payload = msgpack.packb(reply, use_bin_type=True)
+            stdout.write(len(payload).to_bytes(4, "big") + payload)
+            stdout.flush()
+            if opcode == OP_EXIT:
+                return
+            if len(body) < size:
+                # stdin ended in the middle of a frame.
+                break
+        self.redis.flush()
 
 
 if __name__ == "__main__":
+    # Flags may appear anywhere; the remaining arguments are positional.
+    autoload = "--no-autoload" not in sys.argv
+    binary = "--binary" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg not in ("--no-autoload", "--binary")]
+
     # Get command line arguments for savefile_path and expiration_time
-    if len(sys.argv) > 1:
-        savefile_path = sys.argv[1]
+    if len(args) > 0:
+        savefile_path = args[0]
     else:
         savefile_path = "pyredis_dump.json"
 
-    if len(sys.argv) > 2:
-        expiration_time = int(sys.argv[2])
+    if len(args) > 1:
+        expiration_time = int(args[1])
     else:
         expiration_time = 365 * 24 * 60 * 60  # Default to 1 year in seconds
 
-    cli = PyRedisCLI(savefile_path=savefile_path, expiration_time=expiration_time)
-    cli.run()
+    if binary:
+        if _get_msgpack() is None:
+            sys.exit("Error: --binary mode requires msgpack")
+        # stdout carries the reply stream, so informational output must stay off.
+        cli = PyRedisCLI(savefile_path=savefile_path, expiration_time=expiration_time, verbose=False,
+                         autoload=autoload)
+        cli.run_binary()
+    else:
+        cli = PyRedisCLI(savefile_path=savefile_path, expiration_time=expiration_time, autoload=autoload)
+        cli.run()